@@ -1,23 +1,17 @@
-from patterns import detect_patterns
-
-# ... (Previous imports stay the same, but for replace tool I need to match context)
-# I will supply a block that handles the imports and the sidebar/logic update.
-
-# Re-reading file to ensure I match context correctly or just replace the whole file given the complexity of insertions.
-# Since I need to insert imports at the top AND logic in the middle, I'll do two replaces or one big one.
-# Given the tool limitations, I will replace the whole file for safety and cleanliness as I did before. 
-# It ensures I don't miss import placement.
-# Initial version of application logic
-
-
+import copy
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-from data_fetcher import fetch_market_data
-from indicators import calculate_rsi, calculate_macd, calculate_ema, calculate_bollinger_bands
+from data_fetcher import fetch_market_data, clear_market_data_cache, ohlcv_arrays
+from indicators_streaming import EMAState, RSIState, MACDState, BBState
 from patterns import detect_patterns
 
+# Serialize figures with the C-backed orjson encoder instead of stdlib json
+pio.json.config.default_engine = "orjson"
+
 # Page Configuration
 st.set_page_config(page_title="Intraday Market Decision Support", layout="wide")
 
@@ -44,13 +38,85 @@ with show_patterns:
     show_hammer = st.checkbox("Show Hammer", value=False)
     show_engulfing = st.checkbox("Show Engulfing", value=False)
 
-if st.sidebar.button("Fetch Data"):
+def _join(head, tail):
+    """
+    Concatenates indicator outputs, which are either an array or a tuple of arrays.
+    """
+    if isinstance(head, tuple):
+        return tuple(np.concatenate(parts) for parts in zip(head, tail))
+    return np.concatenate((head, tail))
+
+def _finish(entry, close):
+    # The last bar is still forming, so it is evaluated on a copy of the state
+    entry['result'] = _join(entry['closed'], copy.deepcopy(entry['state']).extend(close[-1:]))
+
+def _build_entry(state_cls, close, params):
+    state = state_cls(**params)
+    entry = {'state': state, 'closed': state.extend(close[:-1])}
+    _finish(entry, close)
+    return entry
+
+def _cached(requests, close, executor):
+    """
+    Returns {name: result} for each (name, state_cls, params) request, reusing
+    values computed on a previous rerun for the same dataset and parameters.
+    Missing indicators are computed concurrently on `executor`; the kernels
+    release the GIL. All bars but the last are committed to a streaming state
+    so later fetches can extend them.
+    """
+    cache = st.session_state.setdefault('ind_cache', {})
+    keys = {name: (name, st.session_state.get('ticker'), st.session_state.get('period'),
+                   st.session_state.get('interval'), tuple(sorted(params.items())))
+            for name, _, params in requests}
+    futures = {name: executor.submit(_build_entry, state_cls, close, params)
+               for name, state_cls, params in requests if keys[name] not in cache}
+    for name, future in futures.items():
+        cache[keys[name]] = future.result()
+    return {name: cache[key]['result'] for name, key in keys.items()}
+
+def _extend_cached(close, n_closed):
+    """
+    Feeds the bars after the first `n_closed` into every cached indicator state.
+    """
+    for entry in st.session_state.get('ind_cache', {}).values():
+        entry['closed'] = _join(entry['closed'], entry['state'].extend(close[n_closed:-1]))
+        _finish(entry, close)
+
+def _is_continuation(prev_df, new_df):
+    """
+    True when `new_df` only appends bars to `prev_df`. The last previous bar
+    may still have been forming, so it is allowed to differ.
+    """
+    n_closed = len(prev_df) - 1
+    return (len(new_df) >= len(prev_df)
+            and new_df.index[0] == prev_df.index[0]
+            and new_df.index[:n_closed].equals(prev_df.index[:n_closed]))
+
+fetch_clicked = st.sidebar.button("Fetch Data")
+refresh_clicked = st.sidebar.button("Force Refresh", help="Ignore the one-minute download cache")
+if refresh_clicked:
+    clear_market_data_cache()
+
+if fetch_clicked or refresh_clicked:
     with st.spinner(f"Fetching data for {ticker}..."):
         fetched_df = fetch_market_data(ticker, period, interval)
         
         if not fetched_df.empty:
+            prev_df = st.session_state.get('market_data')
+            same_source = (st.session_state.get('ticker'), st.session_state.get('period'),
+                           st.session_state.get('interval')) == (ticker, period, interval)
             st.session_state['market_data'] = fetched_df
+            st.session_state['arrays'] = ohlcv_arrays(fetched_df)
             st.session_state['ticker'] = ticker
+            st.session_state['period'] = period
+            st.session_state['interval'] = interval
+            if same_source and prev_df is not None and _is_continuation(prev_df, fetched_df):
+                # Only the newly appended bars have to go through the indicators
+                _extend_cached(st.session_state['arrays']['close'], len(prev_df) - 1)
+            else:
+                # New data invalidates every cached indicator result
+                st.session_state['ind_cache'] = {}
+            st.session_state.pop('fig_cache', None)
             st.success(f"Successfully fetched {len(fetched_df)} rows.")
         else:
             st.error("No data found! Please check the ticker symbol and try again.")
@@ -58,124 +124,179 @@ if st.sidebar.button("Fetch Data"):
 
 # Check if data exists in session state
 if 'market_data' in st.session_state:
-    df = st.session_state['market_data'].copy()
+    base = st.session_state['market_data']
     current_ticker = st.session_state.get('ticker', ticker)
+    arrays = st.session_state['arrays']
+    close, high_arr, low_arr = arrays['close'], arrays['high'], arrays['low']
     
     # Calculate Indicators
+    requests = []
     if show_ema:
-        df['EMA'] = calculate_ema(df, period=ema_period)
+        requests.append(('ema', EMAState, {'period': ema_period}))
     if show_bb:
-        df['BB_Upper'], df['BB_Lower'] = calculate_bollinger_bands(df)
+        requests.append(('bb', BBState, {}))
     if show_rsi:
-        df['RSI'] = calculate_rsi(df)
+        requests.append(('rsi', RSIState, {}))
     if show_macd:
-        df['MACD'], df['Signal'], df['Hist'] = calculate_macd(df)
-        
-    # Pattern Recognition
-    if show_doji or show_hammer or show_engulfing:
-        df = detect_patterns(df)
+        requests.append(('macd', MACDState, {}))
 
-    # Create Subplots
-    rows = 1
-    row_heights = [0.7]
-    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Pattern Recognition runs alongside the indicators
+        patterns_future = None
+        if show_doji or show_hammer or show_engulfing:
+            patterns_future = executor.submit(detect_patterns, base)
+        results = _cached(requests, close, executor)
+
+    # Derived columns are collected first and attached in one step; `base`
+    # stays untouched across reruns so it never needs to be copied
+    derived = {}
+    if show_ema:
+        derived['EMA'] = results['ema']
+    if show_bb:
+        derived['BB_Upper'], derived['BB_Lower'] = results['bb']
     if show_rsi:
-        rows += 1
-        row_heights.append(0.15)
+        derived['RSI'] = results['rsi']
     if show_macd:
-        rows += 1
-        row_heights.append(0.15)
+        derived['MACD'], derived['Signal'], derived['Hist'] = results['macd']
+    if patterns_future is not None:
+        derived.update(patterns_future.result().items())
+    df = base.assign(**derived)
+
+    # Reuse the figure from the previous rerun when nothing it depends on has changed
+    fig_key = (current_ticker, interval, show_ema, ema_period, show_bb, show_rsi, show_macd,
+               show_doji, show_hammer, show_engulfing)
+    cached_fig = st.session_state.get('fig_cache')
+    if cached_fig is not None and cached_fig[0] == fig_key:
+        fig = cached_fig[1]
+    else:
+        # Create Subplots
+        rows = 1
+        row_heights = [0.7]
+    
+        if show_rsi:
+            rows += 1
+            row_heights.append(0.15)
+        if show_macd:
+            rows += 1
+            row_heights.append(0.15)
         
-    specs = [[{"secondary_y": False}]]
-    if show_rsi:
-        specs.append([{"secondary_y": False}])
-    if show_macd:
-        specs.append([{"secondary_y": False}])
+        specs = [[{"secondary_y": False}]]
+        if show_rsi:
+            specs.append([{"secondary_y": False}])
+        if show_macd:
+            specs.append([{"secondary_y": False}])
 
-    fig = make_subplots(rows=rows, cols=1, shared_xaxes=True, 
-                        vertical_spacing=0.05, row_heights=row_heights,
-                        specs=specs)
+        fig = make_subplots(rows=rows, cols=1, shared_xaxes=True, 
+                            vertical_spacing=0.05, row_heights=row_heights,
+                            specs=specs)
 
-    # 1. Main Chart
-    fig.add_trace(go.Candlestick(x=df.index,
-        open=df['Open'], high=df['High'], low=df['Low'], close=df['Close'],
-        name="OHLC"), row=1, col=1)
+        # Traces and shapes are collected first and added to the figure in one call each
+        traces = []
+        trace_rows = []
+        shapes = []
 
-    # Overlays
-    if show_ema:
-        if 'EMA' in df.columns:
-            fig.add_trace(go.Scatter(x=df.index, y=df['EMA'], 
-                mode='lines', name=f'EMA {ema_period}', line=dict(color='teal')), row=1, col=1)
+        # 1. Main Chart
+        traces.append(go.Candlestick(x=df.index,
+            open=df['Open'], high=df['High'], low=df['Low'], close=df['Close'],
+            name="OHLC"))
+        trace_rows.append(1)
+
+        # Overlays
+        if show_ema:
+            if 'EMA' in df.columns:
+                traces.append(go.Scattergl(x=df.index, y=df['EMA'], 
+                    mode='lines', name=f'EMA {ema_period}', line=dict(color='teal')))
+                trace_rows.append(1)
     
-    if show_bb:
-        if 'BB_Upper' in df.columns:
-            fig.add_trace(go.Scatter(x=df.index, y=df['BB_Upper'], 
-                mode='lines', name='BB Upper', line=dict(color='gray', width=1), showlegend=False), row=1, col=1)
-            fig.add_trace(go.Scatter(x=df.index, y=df['BB_Lower'], 
-                mode='lines', name='BB Lower', line=dict(color='gray', width=1), fill='tonexty', fillcolor='rgba(128,128,128,0.1)', showlegend=False), row=1, col=1)
-
-    # Patterns Markers
-    if show_doji and 'Pattern_Doji' in df.columns:
-        doji_df = df[df['Pattern_Doji']]
-        if not doji_df.empty:
-            fig.add_trace(go.Scatter(x=doji_df.index, y=doji_df['High'], 
-                mode='markers', name='Doji', marker=dict(symbol='cross', size=8, color='yellow')), row=1, col=1)
-
-    if show_hammer and 'Pattern_Hammer' in df.columns:
-        hammer_df = df[df['Pattern_Hammer']]
-        if not hammer_df.empty:
-            fig.add_trace(go.Scatter(x=hammer_df.index, y=hammer_df['Low'], 
-                mode='markers', name='Hammer', marker=dict(symbol='triangle-up', size=10, color='lime')), row=1, col=1)
-
-    if show_engulfing:
-        if 'Pattern_Bullish_Engulfing' in df.columns:
-            bull_eng = df[df['Pattern_Bullish_Engulfing']]
-            if not bull_eng.empty:
-                fig.add_trace(go.Scatter(x=bull_eng.index, y=bull_eng['Low'], 
-                    mode='markers', name='Bull Engulf', marker=dict(symbol='triangle-up-dot', size=10, color='green')), row=1, col=1)
+        if show_bb:
+            if 'BB_Upper' in df.columns:
+                traces.append(go.Scattergl(x=df.index, y=df['BB_Upper'], 
+                    mode='lines', name='BB Upper', line=dict(color='gray', width=1), showlegend=False))
+                trace_rows.append(1)
+                traces.append(go.Scattergl(x=df.index, y=df['BB_Lower'], 
+                    mode='lines', name='BB Lower', line=dict(color='gray', width=1), fill='tonexty', fillcolor='rgba(128,128,128,0.1)', showlegend=False))
+                trace_rows.append(1)
+
+        # Patterns Markers
+        # Positional indices touch only the index and the one price column
+        # each marker needs, instead of boolean-slicing the whole frame
+        if show_doji and 'Pattern_Doji' in df.columns:
+            idx = np.flatnonzero(df['Pattern_Doji'].to_numpy())
+            if idx.size:
+                traces.append(go.Scattergl(x=df.index[idx], y=high_arr[idx], 
+                    mode='markers', name='Doji', marker=dict(symbol='cross', size=8, color='yellow')))
+                trace_rows.append(1)
+
+        if show_hammer and 'Pattern_Hammer' in df.columns:
+            idx = np.flatnonzero(df['Pattern_Hammer'].to_numpy())
+            if idx.size:
+                traces.append(go.Scattergl(x=df.index[idx], y=low_arr[idx], 
+                    mode='markers', name='Hammer', marker=dict(symbol='triangle-up', size=10, color='lime')))
+                trace_rows.append(1)
+
+        if show_engulfing:
+            if 'Pattern_Bullish_Engulfing' in df.columns:
+                idx = np.flatnonzero(df['Pattern_Bullish_Engulfing'].to_numpy())
+                if idx.size:
+                    traces.append(go.Scattergl(x=df.index[idx], y=low_arr[idx], 
+                        mode='markers', name='Bull Engulf', marker=dict(symbol='triangle-up-dot', size=10, color='green')))
+                    trace_rows.append(1)
         
-        if 'Pattern_Bearish_Engulfing' in df.columns:
-            bear_eng = df[df['Pattern_Bearish_Engulfing']]
-            if not bear_eng.empty:
-                fig.add_trace(go.Scatter(x=bear_eng.index, y=bear_eng['High'], 
-                    mode='markers', name='Bear Engulf', marker=dict(symbol='triangle-down-dot', size=10, color='red')), row=1, col=1)
+            if 'Pattern_Bearish_Engulfing' in df.columns:
+                idx = np.flatnonzero(df['Pattern_Bearish_Engulfing'].to_numpy())
+                if idx.size:
+                    traces.append(go.Scattergl(x=df.index[idx], y=high_arr[idx], 
+                        mode='markers', name='Bear Engulf', marker=dict(symbol='triangle-down-dot', size=10, color='red')))
+                    trace_rows.append(1)
 
-    current_row = 2
-    
-    # RSI
-    if show_rsi:
-        if 'RSI' in df.columns:
-            fig.add_trace(go.Scatter(x=df.index, y=df['RSI'], name="RSI", line=dict(color='purple')), row=current_row, col=1)
-            fig.add_shape(type="line", x0=df.index[0], x1=df.index[-1], y0=70, y1=70, line=dict(color="red", width=1, dash="dash"), row=current_row, col=1)
-            fig.add_shape(type="line", x0=df.index[0], x1=df.index[-1], y0=30, y1=30, line=dict(color="green", width=1, dash="dash"), row=current_row, col=1)
-            fig.update_yaxes(title_text="RSI", range=[0, 100], row=current_row, col=1)
-            current_row += 1
-
-    # MACD
-    if show_macd:
-        if 'MACD' in df.columns:
-            fig.add_trace(go.Scatter(x=df.index, y=df['MACD'], name="MACD", line=dict(color='blue')), row=current_row, col=1)
-            fig.add_trace(go.Scatter(x=df.index, y=df['Signal'], name="Signal", line=dict(color='orange')), row=current_row, col=1)
-            fig.add_trace(go.Bar(x=df.index, y=df['Hist'], name="Hist"), row=current_row, col=1)
-            fig.update_yaxes(title_text="MACD", row=current_row, col=1)
-
-    fig.update_layout(title=f"{current_ticker} - {interval} Intraday Analysis",
-                      xaxis_title="Time",
-                      height=800,
-                      xaxis_rangeslider_visible=False)
+        current_row = 2
     
+        # RSI
+        if show_rsi:
+            if 'RSI' in df.columns:
+                traces.append(go.Scattergl(x=df.index, y=df['RSI'], name="RSI", line=dict(color='purple')))
+                trace_rows.append(current_row)
+                shapes.append(dict(type="line", xref=f"x{current_row}", yref=f"y{current_row}", x0=df.index[0], x1=df.index[-1], y0=70, y1=70, line=dict(color="red", width=1, dash="dash")))
+                shapes.append(dict(type="line", xref=f"x{current_row}", yref=f"y{current_row}", x0=df.index[0], x1=df.index[-1], y0=30, y1=30, line=dict(color="green", width=1, dash="dash")))
+                fig.update_yaxes(title_text="RSI", range=[0, 100], row=current_row, col=1)
+                current_row += 1
+
+        # MACD
+        if show_macd:
+            if 'MACD' in df.columns:
+                traces.append(go.Scattergl(x=df.index, y=df['MACD'], name="MACD", line=dict(color='blue')))
+                trace_rows.append(current_row)
+                traces.append(go.Scattergl(x=df.index, y=df['Signal'], name="Signal", line=dict(color='orange')))
+                trace_rows.append(current_row)
+                traces.append(go.Bar(x=df.index, y=df['Hist'], name="Hist"))
+                trace_rows.append(current_row)
+                fig.update_yaxes(title_text="MACD", row=current_row, col=1)
+
+        fig.add_traces(traces, rows=trace_rows, cols=[1] * len(traces))
+        fig.update_layout(title=f"{current_ticker} - {interval} Intraday Analysis",
+                          xaxis_title="Time",
+                          height=800,
+                          xaxis_rangeslider_visible=False,
+                          uirevision='keep',
+                          shapes=shapes)
+        st.session_state['fig_cache'] = (fig_key, fig)
+
     st.plotly_chart(fig, width="stretch")
 
     # Display Data Table with Patterns
     with st.expander("View Raw Data", expanded=False):
         # Format boolean columns to text for better readability if present
-        display_df = df.copy()
-        if 'Pattern_Doji' in display_df.columns:
-            display_df['Doji'] = display_df['Pattern_Doji'].apply(lambda x: '✅' if x else '')
-        if 'Pattern_Hammer' in display_df.columns:
-            display_df['Hammer'] = display_df['Pattern_Hammer'].apply(lambda x: '✅' if x else '')
-            
-        st.dataframe(display_df.style.format("{:.2f}", subset=['Open', 'High', 'Low', 'Close', 'Volume', 'EMA', 'RSI', 'MACD']))
+        labels = {}
+        if 'Pattern_Doji' in df.columns:
+            labels['Doji'] = np.where(df['Pattern_Doji'].to_numpy(), '✅', '')
+        if 'Pattern_Hammer' in df.columns:
+            labels['Hammer'] = np.where(df['Pattern_Hammer'].to_numpy(), '✅', '')
+        display_df = df.assign(**labels) if labels else df
+
+        # Let the frontend format numbers instead of a Styler formatting every cell in Python
+        numeric_cols = [c for c in ['Open', 'High', 'Low', 'Close', 'Volume', 'EMA', 'RSI', 'MACD'] if c in display_df.columns]
+        st.dataframe(display_df,
+                     column_config={c: st.column_config.NumberColumn(format="%.2f") for c in numeric_cols})
 
 
 st.sidebar.markdown("---")
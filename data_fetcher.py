@@ -4,12 +4,52 @@ Project: AI-Based Intraday Market Decision Support System
 Description: Fetches intraday stock market data as described in the project documentation.
 """
 
+import streamlit as st
 import yfinance as yf
 import pandas as pd
+import numpy as np
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _download_market_data(ticker: str, period: str, interval: str) -> pd.DataFrame:
+    """
+    Downloads and cleans the OHLCV data, cached for 60 seconds.
+    Raises instead of returning an empty frame: st.cache_data does not cache
+    exceptions, so a failed or empty download is retried on the next call.
+    """
+    df = yf.download(tickers=ticker, period=period, interval=interval, progress=False)
+    df.index = pd.to_datetime(df.index)
+    if df.index.tz is None:
+        # If timezone-naive, assume UTC then convert
+        df.index = df.index.tz_localize("UTC").tz_convert("Asia/Kolkata")
+    else:
+        # If already timezone-aware, just convert
+        df.index = df.index.tz_convert("Asia/Kolkata")
+
+    if df.empty:
+        raise ValueError(f"No data found for {ticker}")
+
+    # Flatten MultiIndex columns if present (common in new yfinance versions)
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+
+    # Standardize columns
+    df = df[OHLCV_COLUMNS] # Keep only OHLCV
+    
+    # Drop rows with missing values
+    df.dropna(inplace=True)
+
+    # Single float32 block: ample precision for prices and half the
+    # bytes for every indicator pass and chart serialization
+    df = df.astype('float32')
+
+    return df
 
 def fetch_market_data(ticker: str, period: str = "1d", interval: str = "5m") -> pd.DataFrame:
     """
     Fetches intraday market data from Yahoo Finance.
+    Successful downloads are cached for 60 seconds; call clear_market_data_cache() to force a download.
 
     Args:
         ticker (str): The stock ticker symbol (e.g., '^NSEI', 'RELIANCE.NS').
@@ -21,33 +61,22 @@ def fetch_market_data(ticker: str, period: str = "1d", interval: str = "5m") ->
                       Returns empty DataFrame if no data found.
     """
     try:
-        # Fetch data
-        df = yf.download(tickers=ticker, period=period, interval=interval, progress=False)
-        df.index = pd.to_datetime(df.index)
-        if df.index.tz is None:
-    # If timezone-naive, assume UTC then convert
-           df.index = df.index.tz_localize("UTC").tz_convert("Asia/Kolkata")
-        else:
-    # If already timezone-aware, just convert
-           df.index = df.index.tz_convert("Asia/Kolkata")
-
-        if df.empty:
-            print(f"No data found for {ticker}")
-            return pd.DataFrame()
-
-        # Flatten MultiIndex columns if present (common in new yfinance versions)
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-
-        # Standardize columns
-        required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-        df = df[required_cols] # Keep only OHLCV
-        
-        # Drop rows with missing values
-        df.dropna(inplace=True)
-
-        return df
-
+        return _download_market_data(ticker, period, interval)
     except Exception as e:
         print(f"Error fetching data for {ticker}: {e}")
         return pd.DataFrame()
+
+def clear_market_data_cache():
+    """
+    Drops the cached downloads so the next fetch goes to Yahoo Finance.
+    """
+    _download_market_data.clear()
+
+def ohlcv_arrays(df: pd.DataFrame) -> dict:
+    """
+    Converts the OHLCV columns into contiguous NumPy arrays, keeping their dtype.
+
+    Returns:
+        dict: Arrays keyed by lower-case column name ('open', 'high', 'low', 'close', 'volume').
+    """
+    return {col.lower(): np.ascontiguousarray(df[col].to_numpy()) for col in OHLCV_COLUMNS}
@@ -1,4 +1,11 @@
 import pandas as pd
+import numpy as np
+
+def _signal(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """
+    Combines buy/sell masks into a compact signal array: 1 (Buy), -1 (Sell), 0 (Hold).
+    """
+    return np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
 
 def generate_signals(df):
     """
@@ -11,37 +18,36 @@ def generate_signals(df):
         pd.DataFrame: DataFrame with added signal columns (e.g., 'Signal_EMA', 'Signal_RSI')
                       Logic: 1 (Buy), -1 (Sell), 0 (Hold)
     """
-    
+    close = df['Close'].to_numpy()
+
     # 1. EMA Signal
     # BUY if Close > EMA
     # SELL if Close < EMA
     if 'EMA' in df.columns:
-        df['Signal_EMA'] = 0
-        df.loc[df['Close'] > df['EMA'], 'Signal_EMA'] = 1
-        df.loc[df['Close'] < df['EMA'], 'Signal_EMA'] = -1
+        ema = df['EMA'].to_numpy()
+        df['Signal_EMA'] = _signal(close > ema, close < ema)
 
     # 2. RSI Signal
     # BUY if RSI < 30
     # SELL if RSI > 70
     if 'RSI' in df.columns:
-        df['Signal_RSI'] = 0
-        df.loc[df['RSI'] < 30, 'Signal_RSI'] = 1
-        df.loc[df['RSI'] > 70, 'Signal_RSI'] = -1
+        rsi = df['RSI'].to_numpy()
+        df['Signal_RSI'] = _signal(rsi < 30, rsi > 70)
 
     # 3. MACD Signal
     # BUY if MACD > Signal
     # SELL if MACD < Signal
     if 'MACD' in df.columns and 'MACD_Signal' in df.columns:
-        df['Signal_MACD'] = 0
-        df.loc[df['MACD'] > df['MACD_Signal'], 'Signal_MACD'] = 1
-        df.loc[df['MACD'] < df['MACD_Signal'], 'Signal_MACD'] = -1
+        macd = df['MACD'].to_numpy()
+        macd_signal = df['MACD_Signal'].to_numpy()
+        df['Signal_MACD'] = _signal(macd > macd_signal, macd < macd_signal)
 
     # 4. Bollinger Bands Signal
     # BUY if Close < Lower Band
     # SELL if Close > Upper Band
     if 'BB_Lower' in df.columns and 'BB_Upper' in df.columns:
-        df['Signal_BB'] = 0
-        df.loc[df['Close'] < df['BB_Lower'], 'Signal_BB'] = 1
-        df.loc[df['Close'] > df['BB_Upper'], 'Signal_BB'] = -1
+        bb_lower = df['BB_Lower'].to_numpy()
+        bb_upper = df['BB_Upper'].to_numpy()
+        df['Signal_BB'] = _signal(close < bb_lower, close > bb_upper)
 
     return df
@@ -6,18 +6,29 @@ Description: Implements indicators referenced in the project report.
 
 import pandas as pd
 import numpy as np
+from indicators_streaming import EMAState, RSIState, MACDState, BBState
+
+def calculate_rsi_array(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Calculates RSI directly on an array of closing prices.
+    The first `period` values are NaN while the averages are seeded.
+    """
+    return RSIState(period).extend(close)
 
 def calculate_rsi(data: pd.DataFrame, period: int = 14) -> pd.Series:
     """
-    Calculates the Relative Strength Index (RSI).
+    Calculates the Relative Strength Index (RSI) with Wilder's smoothing.
     """
-    delta = data['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    close = data['Close'].to_numpy()
+    return pd.Series(calculate_rsi_array(close, period), index=data.index)
 
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+def calculate_macd_array(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
+    """
+    Calculates MACD directly on an array of closing prices.
+    Returns:
+        macd_line, signal_line, histogram as arrays
+    """
+    return MACDState(fast, slow, signal).extend(close)
 
 def calculate_macd(data: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
     """
@@ -25,18 +36,34 @@ def calculate_macd(data: pd.DataFrame, fast: int = 12, slow: int = 26, signal: i
     Returns:
         macd_line, signal_line, histogram
     """
-    exp1 = data['Close'].ewm(span=fast, adjust=False).mean()
-    exp2 = data['Close'].ewm(span=slow, adjust=False).mean()
-    macd_line = exp1 - exp2
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    histogram = macd_line - signal_line
-    return macd_line, signal_line, histogram
+    close = data['Close'].to_numpy()
+    macd_line, signal_line, histogram = calculate_macd_array(close, fast, slow, signal)
+    return (pd.Series(macd_line, index=data.index),
+            pd.Series(signal_line, index=data.index),
+            pd.Series(histogram, index=data.index))
+
+def calculate_ema_array(close: np.ndarray, period: int = 20) -> np.ndarray:
+    """
+    Calculates EMA directly on an array of closing prices.
+    Equivalent to pandas' ewm(adjust=False): NaN prices carry the last value forward.
+    """
+    return EMAState(period).extend(close)
 
 def calculate_ema(data: pd.DataFrame, period: int = 20) -> pd.Series:
     """
     Calculates Exponential Moving Average (EMA).
     """
-    return data['Close'].ewm(span=period, adjust=False).mean()
+    close = data['Close'].to_numpy()
+    return pd.Series(calculate_ema_array(close, period), index=data.index)
+
+def calculate_bollinger_bands_array(close: np.ndarray, period: int = 20, std: int = 2) -> tuple:
+    """
+    Calculates Bollinger Bands directly on an array of closing prices.
+    Uses the sample standard deviation to match pandas' rolling().std().
+    Returns:
+        upper_band, lower_band as arrays
+    """
+    return BBState(period, std).extend(close)
 
 def calculate_bollinger_bands(data: pd.DataFrame, period: int = 20, std: int = 2) -> tuple:
     """
@@ -44,8 +71,6 @@ def calculate_bollinger_bands(data: pd.DataFrame, period: int = 20, std: int = 2
     Returns:
         upper_band, lower_band
     """
-    sma = data['Close'].rolling(window=period).mean()
-    std_dev = data['Close'].rolling(window=period).std()
-    upper_band = sma + (std_dev * std)
-    lower_band = sma - (std_dev * std)
-    return upper_band, lower_band
+    close = data['Close'].to_numpy()
+    upper_band, lower_band = calculate_bollinger_bands_array(close, period, std)
+    return pd.Series(upper_band, index=data.index), pd.Series(lower_band, index=data.index)
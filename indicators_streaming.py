@@ -0,0 +1,254 @@
+"""
+Module: Streaming Indicators
+Project: AI-Based Intraday Market Decision Support System
+Description: Incremental versions of the technical indicators. Each state object
+             remembers what it has seen so new bars extend previous results
+             instead of recomputing the full history. The batch functions in
+             indicators.py run these same kernels from a fresh state.
+"""
+
+from dataclasses import dataclass, field
+import numpy as np
+from numba import njit
+
+# Same as fastmath=True minus 'nnan'/'ninf', which would fold the NaN checks away
+_FASTMATH_NAN_SAFE = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+def _as_float(close: np.ndarray) -> np.ndarray:
+    """
+    Kernel outputs follow the input dtype: float32 prices stay float32,
+    integer prices are promoted to float64 so results aren't truncated.
+    """
+    close = np.asarray(close)
+    return close.astype(np.result_type(close.dtype, np.float32), copy=False)
+
+@njit(inline='always')
+def _ema_gap(prev: float, x: float, alpha: float, missing: int) -> float:
+    # pandas' ewm(adjust=False) after `missing` NaN prices: the previous value's
+    # weight has decayed by (1 - alpha) per bar while the new price keeps alpha
+    w = (1.0 - alpha) ** (missing + 1)
+    return (w * prev + alpha * x) / (w + alpha)
+
+@njit(cache=True, fastmath=_FASTMATH_NAN_SAFE, nogil=True)
+def _ema_extend(close, alpha, value, missing, count):
+    n = close.shape[0]
+    out = np.empty_like(close)
+    for j in range(n):
+        x = close[j]
+        if np.isnan(x):
+            missing += 1
+        else:
+            if np.isnan(value):
+                value = x
+            elif missing:
+                value = _ema_gap(value, x, alpha, missing)
+            else:
+                value += alpha * (x - value)
+            missing = 0
+        out[j] = value
+        count += 1
+    return out, value, missing, count
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _rsi_extend(close, period, avg_gain, avg_loss, prev_close, count):
+    n = close.shape[0]
+    out = np.full_like(close, np.nan)
+    for j in range(n):
+        if count > 0:
+            delta = close[j] - prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if count <= period:
+                avg_gain += gain / period
+                avg_loss += loss / period
+            else:
+                avg_gain = (avg_gain * (period - 1) + gain) / period
+                avg_loss = (avg_loss * (period - 1) + loss) / period
+            if count >= period:
+                if avg_loss > 0:
+                    out[j] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+                elif avg_gain > 0:
+                    out[j] = 100.0
+        prev_close = close[j]
+        count += 1
+    return out, avg_gain, avg_loss, prev_close, count
+
+@njit(cache=True, fastmath=_FASTMATH_NAN_SAFE, nogil=True)
+def _macd_extend(close, a_fast, a_slow, a_sig, e1, e2, sig, missing, count):
+    n = close.shape[0]
+    macd_out = np.empty_like(close)
+    sig_out = np.empty_like(close)
+    hist_out = np.empty_like(close)
+    for j in range(n):
+        x = close[j]
+        if np.isnan(x):
+            missing += 1
+        else:
+            if np.isnan(e1):
+                e1 = x
+                e2 = x
+            elif missing:
+                e1 = _ema_gap(e1, x, a_fast, missing)
+                e2 = _ema_gap(e2, x, a_slow, missing)
+            else:
+                e1 += a_fast * (x - e1)
+                e2 += a_slow * (x - e2)
+            missing = 0
+        if np.isnan(sig):
+            sig = e1 - e2
+        else:
+            sig += a_sig * ((e1 - e2) - sig)
+        macd_out[j] = e1 - e2
+        sig_out[j] = sig
+        hist_out[j] = e1 - e2 - sig
+        count += 1
+    return macd_out, sig_out, hist_out, e1, e2, sig, missing, count
+
+@njit(cache=True, fastmath=_FASTMATH_NAN_SAFE, nogil=True)
+def _bb_extend(close, period, k, ring, s, sq, shift, missing, count):
+    n = close.shape[0]
+    upper = np.full_like(close, np.nan)
+    lower = np.full_like(close, np.nan)
+    if period < 2:
+        return upper, lower, s, sq, shift, missing, count
+    for j in range(n):
+        slot = count % period
+        if count >= period:
+            old = ring[slot]
+            if np.isnan(old):
+                missing -= 1
+            else:
+                s -= old
+                sq -= old * old
+        if np.isnan(close[j]):
+            # As with pandas' rolling(), a missing price blanks the bands
+            # until it has left the window; it never enters the sums
+            ring[slot] = np.nan
+            missing += 1
+        else:
+            if np.isnan(shift):
+                shift = close[j]
+            # Promote before squaring so float32 prices don't round x * x
+            x = np.float64(close[j]) - shift
+            ring[slot] = x
+            s += x
+            sq += x * x
+        count += 1
+        if count >= period and missing == 0:
+            mean = s / period
+            var = (sq - s * mean) / (period - 1)
+            std = np.sqrt(max(var, 0.0))
+            upper[j] = shift + mean + k * std
+            lower[j] = shift + mean - k * std
+    return upper, lower, s, sq, shift, missing, count
+
+@dataclass
+class EMAState:
+    """
+    Exponential Moving Average state (matches indicators.calculate_ema).
+    """
+    period: int = 20
+    alpha: float = field(init=False)
+    value: float = np.nan  # NaN until the first price arrives
+    missing: int = 0  # NaN prices since the last real one
+    count: int = 0
+
+    def __post_init__(self):
+        self.alpha = 2 / (self.period + 1)
+
+    def extend(self, close: np.ndarray) -> np.ndarray:
+        out, self.value, self.missing, self.count = _ema_extend(
+            _as_float(close), self.alpha, self.value, self.missing, self.count)
+        return out
+
+    def update(self, price: float) -> float:
+        return self.extend(np.array([price], dtype=np.float64))[0]
+
+@dataclass
+class RSIState:
+    """
+    Relative Strength Index state using Wilder's smoothing (matches indicators.calculate_rsi).
+    """
+    period: int = 14
+    avg_gain: float = 0.0
+    avg_loss: float = 0.0
+    prev_close: float = 0.0
+    count: int = 0
+
+    def extend(self, close: np.ndarray) -> np.ndarray:
+        out, self.avg_gain, self.avg_loss, self.prev_close, self.count = _rsi_extend(
+            _as_float(close), self.period, self.avg_gain, self.avg_loss, self.prev_close, self.count)
+        return out
+
+    def update(self, price: float) -> float:
+        return self.extend(np.array([price], dtype=np.float64))[0]
+
+@dataclass
+class MACDState:
+    """
+    MACD state (matches indicators.calculate_macd).
+    """
+    fast: int = 12
+    slow: int = 26
+    signal: int = 9
+    e1: float = np.nan  # NaN until the first price arrives
+    e2: float = np.nan
+    sig: float = np.nan
+    missing: int = 0  # NaN prices since the last real one
+    count: int = 0
+
+    def extend(self, close: np.ndarray) -> tuple:
+        """
+        Returns:
+            macd_line, signal_line, histogram for the new closes
+        """
+        (macd_line, signal_line, histogram,
+         self.e1, self.e2, self.sig, self.missing, self.count) = _macd_extend(
+            _as_float(close), 2 / (self.fast + 1), 2 / (self.slow + 1), 2 / (self.signal + 1),
+            self.e1, self.e2, self.sig, self.missing, self.count)
+        return macd_line, signal_line, histogram
+
+    def update(self, price: float) -> tuple:
+        return tuple(a[0] for a in self.extend(np.array([price], dtype=np.float64)))
+
+@dataclass
+class BBState:
+    """
+    Bollinger Bands state: a ring buffer of the last `period` closes plus
+    running sum and sum of squares (matches indicators.calculate_bollinger_bands).
+    """
+    period: int = 20
+    std: int = 2
+    ring: np.ndarray = field(init=False)
+    s: float = 0.0
+    sq: float = 0.0
+    shift: float = np.nan  # first real price, set when it arrives
+    missing: int = 0  # NaN prices inside the window
+    count: int = 0
+
+    def __post_init__(self):
+        self.ring = np.zeros(max(self.period, 1))
+
+    def extend(self, close: np.ndarray) -> tuple:
+        """
+        Returns:
+            upper_band, lower_band for the new closes
+        """
+        upper_band, lower_band, self.s, self.sq, self.shift, self.missing, self.count = _bb_extend(
+            _as_float(close), self.period, float(self.std), self.ring,
+            self.s, self.sq, self.shift, self.missing, self.count)
+        return upper_band, lower_band
+
+    def update(self, price: float) -> tuple:
+        return tuple(a[0] for a in self.extend(np.array([price], dtype=np.float64)))
+
+# Compile the kernels at import so the first Streamlit render doesn't pay for it.
+# ohlcv_arrays() hands out read-only views (pandas copy-on-write), which Numba
+# compiles separately from writable arrays, so both are warmed up.
+_warmup = np.zeros(2, dtype=np.float32)
+_warmup_readonly = _warmup.copy()
+_warmup_readonly.flags.writeable = False
+for _state in (EMAState(), RSIState(), MACDState(), BBState()):
+    _state.extend(_warmup)
+    _state.extend(_warmup_readonly)
+del _state
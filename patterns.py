@@ -4,78 +4,103 @@ Project: AI-Based Intraday Market Decision Support System
 Description: Detects chart patterns mentioned in the project PDF.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
+from numba import njit
+
+PATTERN_COLUMNS = ['Pattern_Doji', 'Pattern_Hammer', 'Pattern_Bullish_Engulfing', 'Pattern_Bearish_Engulfing']
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _patterns_njit(o, h, l, c, doji, hammer, bullish, bearish):
+    """
+    Single pass over the candles writing all four pattern masks.
+    Rows with missing prices compare False, as they would in NumPy.
+    """
+    for i in range(o.shape[0]):
+        # Calculate absolute body size and shadow sizes
+        body = abs(c[i] - o[i])
+        upper_shadow = h[i] - max(o[i], c[i])
+        lower_shadow = min(o[i], c[i]) - l[i]
+        total_range = h[i] - l[i]
+
+        # 1. Doji
+        # Definition: Body is very small relative to total range (e.g., < 10% of range or very small absolute value)
+        doji[i] = body <= (0.1 * total_range)
+
+        # 2. Hammer
+        # Definition: Small body, Long lower shadow (>= 2x body), Short upper shadow
+        # Bullish signal if it appears in a downtrend (we will just identify the shape here)
+        hammer[i] = ((body < (0.3 * total_range)) &   # Small body
+                     (lower_shadow >= (2.0 * body)) &  # Long lower wick
+                     (upper_shadow <= body))           # Short upper wick
+
+        # 3. Engulfing
+        # Definition: 
+        # Bullish: Previous Red, Current Green, Current Body > Previous Body, Current Open < Prev Close, Current Close > Prev Open
+        # Bearish: Previous Green, Current Red, Current Body > Previous Body, Current Open > Prev Close, Current Close < Prev Open
+        # Simplified Engulfing (Just body engulfing body for robustness, strict definition matches open/close exactly)
+        # Using loose definition: Current body fully engulfs previous body
+        # The current candle's colour needs no separate check: for a red previous
+        # candle, Open <= prev_close < prev_open <= Close already makes it green
+        # (and vice versa for bearish)
+        if i > 0:
+            prev_open = o[i - 1]
+            prev_close = c[i - 1]
+            bullish[i] = (prev_close < prev_open) & (o[i] <= prev_close) & (c[i] >= prev_open)
+            bearish[i] = (prev_close > prev_open) & (o[i] >= prev_close) & (c[i] <= prev_open)
+        else:
+            # The first row has no predecessor
+            bullish[i] = False
+            bearish[i] = False
 
 def detect_patterns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Detects candlestick patterns: Doji, Hammer, Engulfing.
-    Adds boolean columns to the dataframe:
+    Returns a dataframe aligned on df.index holding only the boolean columns:
     - 'Pattern_Doji'
     - 'Pattern_Hammer'
     - 'Pattern_Bullish_Engulfing'
     - 'Pattern_Bearish_Engulfing'
+    Use pd.concat([df, patterns], axis=1) where the merged view is needed.
     """
-    df = df.copy()
+    # One extraction of the OHLC block; each row of the transpose is a contiguous column.
+    # The working arrays are float32 (a no-op for data from fetch_market_data);
+    # df's own columns are left as they are.
+    o, h, l, c = df[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float32, copy=False).T
+
+    # Empty or all-NaN input (pre-market, halted symbols) cannot match anything.
+    # Checking the first row first keeps the full NaN scan off the normal path.
+    n = len(o)
+    if n == 0 or (np.isnan(o[0]) and np.isnan(o).all()):
+        return pd.DataFrame(np.zeros((n, len(PATTERN_COLUMNS)), dtype=bool), index=df.index, columns=PATTERN_COLUMNS)
+
+    # A single buffer holds all four masks: the kernel fills its rows in place and
+    # the returned frame wraps it without copying
+    flags = np.empty((len(PATTERN_COLUMNS), n), dtype=bool)
+    _patterns_njit(o, h, l, c, *flags)
 
-    # Calculate absolute body size and shadow sizes
-    df['Body'] = abs(df['Close'] - df['Open'])
-    df['Upper_Shadow'] = df['High'] - df[['Open', 'Close']].max(axis=1)
-    df['Lower_Shadow'] = df[['Open', 'Close']].min(axis=1) - df['Low']
-    df['Total_Range'] = df['High'] - df['Low']
-    
-    # Avoid division by zero
-    avg_body_size = df['Body'].mean()
-    
-    # 1. Doji
-    # Definition: Body is very small relative to total range (e.g., < 10% of range or very small absolute value)
-    df['Pattern_Doji'] = df['Body'] <= (0.1 * df['Total_Range'])
+    return pd.DataFrame(flags.T, index=df.index, columns=PATTERN_COLUMNS, copy=False)
 
-    # 2. Hammer
-    # Definition: Small body, Long lower shadow (>= 2x body), Short upper shadow
-    # Bullish signal if it appears in a downtrend (we will just identify the shape here)
-    condition_hammer_body = df['Body'] < (0.3 * df['Total_Range']) # Small body
-    condition_long_lower = df['Lower_Shadow'] >= (2.0 * df['Body']) # Long lower wick
-    condition_short_upper = df['Upper_Shadow'] <= (1.0 * df['Body']) # Short upper wick
-    
-    df['Pattern_Hammer'] = condition_hammer_body & condition_long_lower & condition_short_upper
+def detect_patterns_batch(frames: dict, max_workers: int = None) -> dict:
+    """
+    Runs detect_patterns for several symbols concurrently.
+    The pattern kernel releases the GIL, so the threads run in parallel.
+
+    Args:
+        frames (dict): OHLC DataFrames keyed by ticker symbol.
+        max_workers (int): Thread count; defaults to the executor's choice.
 
-    # 3. Engulfing
-    # Definition: 
-    # Bullish: Previous Red, Current Green, Current Body > Previous Body, Current Open < Prev Close, Current Close > Prev Open
-    # Bearish: Previous Green, Current Red, Current Body > Previous Body, Current Open > Prev Close, Current Close < Prev Open
-    
-    # Vectorized comparison with shifted values
-    prev_open = df['Open'].shift(1)
-    prev_close = df['Close'].shift(1)
-    prev_body = df['Body'].shift(1)
-    
-    is_prev_red = prev_close < prev_open
-    is_prev_green = prev_close > prev_open
-    
-    is_curr_green = df['Close'] > df['Open']
-    is_curr_red = df['Close'] < df['Open']
-    
-    # Simplified Engulfing (Just body engulfing body for robustness, strict definition matches open/close exactly)
-    # Using loose definition: Current body fully engulfs previous body
-    
-    # Bullish Engulfing
-    df['Pattern_Bullish_Engulfing'] = (
-        is_prev_red & 
-        is_curr_green & 
-        (df['Open'] <= prev_close) & 
-        (df['Close'] >= prev_open)
-    )
+    Returns:
+        dict: detect_patterns results keyed by the same symbols.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(frames, executor.map(detect_patterns, frames.values())))
 
-    # Bearish Engulfing
-    df['Pattern_Bearish_Engulfing'] = (
-        is_prev_green & 
-        is_curr_red & 
-        (df['Open'] >= prev_close) & 
-        (df['Close'] <= prev_open)
-    )
-    
-    # Cleanup temporary columns
-    df.drop(columns=['Body', 'Upper_Shadow', 'Lower_Shadow', 'Total_Range'], inplace=True)
-    
-    return df
+# Compile the kernel at import so the first Streamlit render doesn't pay for it.
+# Prices from fetch_market_data reach the kernel as read-only views (pandas
+# copy-on-write), so that is the specialization to build; other layouts
+# (sliced frames, writable copies) compile on first use.
+_warmup = np.zeros((4, 2), dtype=np.float32)
+_warmup.flags.writeable = False
+_patterns_njit(*_warmup, *np.empty((4, 2), dtype=bool))
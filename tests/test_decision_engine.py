@@ -9,9 +9,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 's
 from decision_engine import generate_signals
 
 class TestDecisionEngine(unittest.TestCase):
-    def setUp(self):
-        # Create a base dataframe with neutral values
-        self.base_df = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        # Create a base dataframe with neutral values once; each test works on a copy
+        cls.base_df = pd.DataFrame({
             'Close': [100.0] * 5,
             'RSI': [50.0] * 5,
             'MACD': [0.0] * 5,
@@ -0,0 +1,133 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from indicators import calculate_rsi, calculate_ema, calculate_macd, calculate_bollinger_bands
+
+def wilder_rsi(close, period):
+    # Plain Python reference implementation of Wilder's RSI
+    deltas = np.diff(close)
+    gains = np.clip(deltas, 0, None)
+    losses = np.clip(-deltas, 0, None)
+    out = [np.nan] * len(close)
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+    out[period] = 100 - 100 / (1 + avg_gain / avg_loss)
+    for i in range(period, len(deltas)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        out[i + 1] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return np.array(out)
+
+class TestIndicators(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        close = 100 + np.cumsum(rng.normal(0, 1, 200))
+        self.df = pd.DataFrame({'Close': close},
+                               index=pd.date_range("2024-01-01 09:15", periods=200, freq="5min"))
+
+    def test_rsi_matches_wilder_reference(self):
+        result = calculate_rsi(self.df, period=14)
+        expected = wilder_rsi(self.df['Close'].to_numpy(), 14)
+        self.assertTrue(result.index.equals(self.df.index))
+        self.assertTrue(result.iloc[:14].isna().all())
+        np.testing.assert_allclose(result.to_numpy()[14:], expected[14:], rtol=1e-9)
+
+    def test_rsi_only_gains(self):
+        df = pd.DataFrame({'Close': np.arange(1.0, 31.0)})
+        result = calculate_rsi(df, period=14)
+        self.assertTrue((result.iloc[14:] == 100.0).all())
+
+    def test_rsi_short_series(self):
+        df = pd.DataFrame({'Close': [1.0, 2.0, 3.0]})
+        self.assertTrue(calculate_rsi(df, period=14).isna().all())
+
+    def test_ema_matches_pandas(self):
+        result = calculate_ema(self.df, period=20)
+        expected = self.df['Close'].ewm(span=20, adjust=False).mean()
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-9)
+
+    def test_macd_matches_pandas(self):
+        macd_line, signal_line, histogram = calculate_macd(self.df)
+        exp1 = self.df['Close'].ewm(span=12, adjust=False).mean()
+        exp2 = self.df['Close'].ewm(span=26, adjust=False).mean()
+        expected_macd = exp1 - exp2
+        expected_signal = expected_macd.ewm(span=9, adjust=False).mean()
+        np.testing.assert_allclose(macd_line.to_numpy(), expected_macd.to_numpy(), atol=1e-9)
+        np.testing.assert_allclose(signal_line.to_numpy(), expected_signal.to_numpy(), atol=1e-9)
+        np.testing.assert_allclose(histogram.to_numpy(), (expected_macd - expected_signal).to_numpy(), atol=1e-9)
+
+    def test_ema_and_macd_carry_through_missing_prices(self):
+        gappy = self.df.copy()
+        gappy.iloc[[0, 1, 50, 51, 52, 120], 0] = np.nan
+        ema = calculate_ema(gappy, period=20)
+        expected = gappy['Close'].ewm(span=20, adjust=False).mean()
+        self.assertEqual(ema.isna().sum(), 2)
+        np.testing.assert_allclose(ema.to_numpy(), expected.to_numpy(), rtol=1e-9)
+
+        macd_line, signal_line, _ = calculate_macd(gappy)
+        expected_macd = (gappy['Close'].ewm(span=12, adjust=False).mean()
+                         - gappy['Close'].ewm(span=26, adjust=False).mean())
+        expected_signal = expected_macd.ewm(span=9, adjust=False).mean()
+        np.testing.assert_allclose(macd_line.to_numpy(), expected_macd.to_numpy(), atol=1e-9)
+        np.testing.assert_allclose(signal_line.to_numpy(), expected_signal.to_numpy(), atol=1e-9)
+
+    def test_bollinger_matches_pandas(self):
+        upper, lower = calculate_bollinger_bands(self.df, period=20, std=2)
+        sma = self.df['Close'].rolling(window=20).mean()
+        std_dev = self.df['Close'].rolling(window=20).std()
+        self.assertTrue(upper.iloc[:19].isna().all())
+        np.testing.assert_allclose(upper.to_numpy()[19:], (sma + 2 * std_dev).to_numpy()[19:], rtol=1e-9)
+        np.testing.assert_allclose(lower.to_numpy()[19:], (sma - 2 * std_dev).to_numpy()[19:], rtol=1e-9)
+
+    def test_bollinger_recovers_after_missing_prices(self):
+        gappy = self.df.copy()
+        gappy.iloc[[0, 60, 61], 0] = np.nan
+        upper, lower = calculate_bollinger_bands(gappy, period=20, std=2)
+        sma = gappy['Close'].rolling(window=20).mean()
+        std_dev = gappy['Close'].rolling(window=20).std()
+        expected_upper = sma + 2 * std_dev
+        np.testing.assert_array_equal(upper.isna().to_numpy(), expected_upper.isna().to_numpy())
+        self.assertFalse(upper.iloc[81:].isna().any())
+        np.testing.assert_allclose(upper.to_numpy(), expected_upper.to_numpy(), rtol=1e-9)
+        np.testing.assert_allclose(lower.to_numpy(), (sma - 2 * std_dev).to_numpy(), rtol=1e-9)
+
+    def test_float32_input_keeps_dtype(self):
+        df32 = self.df.astype('float32')
+        rsi = calculate_rsi(df32, period=14)
+        upper, lower = calculate_bollinger_bands(df32, period=20, std=2)
+        self.assertEqual(rsi.dtype, np.float32)
+        self.assertEqual(upper.dtype, np.float32)
+        np.testing.assert_allclose(rsi.to_numpy()[14:], calculate_rsi(self.df).to_numpy()[14:], rtol=1e-3)
+        np.testing.assert_allclose(upper.to_numpy()[19:], calculate_bollinger_bands(self.df)[0].to_numpy()[19:], rtol=1e-4)
+
+    def test_integer_input_returns_float(self):
+        df_int = self.df.round().astype('int64')
+        df_float = df_int.astype('float64')
+        rsi = calculate_rsi(df_int, period=14)
+        ema = calculate_ema(df_int, period=20)
+        upper, lower = calculate_bollinger_bands(df_int, period=20, std=2)
+        macd = calculate_macd(df_int)
+        for result in (rsi, ema, upper, lower) + macd:
+            self.assertEqual(result.dtype, np.float64)
+        self.assertTrue(rsi.iloc[:14].isna().all())
+        self.assertTrue(upper.iloc[:19].isna().all())
+        pd.testing.assert_series_equal(ema, calculate_ema(df_float, period=20))
+        pd.testing.assert_series_equal(rsi, calculate_rsi(df_float, period=14))
+        pd.testing.assert_series_equal(upper, calculate_bollinger_bands(df_float, period=20, std=2)[0])
+        for result, expected in zip(macd, calculate_macd(df_float)):
+            pd.testing.assert_series_equal(result, expected)
+
+    def test_float32_flat_window_has_zero_width(self):
+        # A ramp, then a full window at one price: the bands must collapse onto it
+        close = np.full(60, 22345.65, dtype=np.float32)
+        close[:25] = np.linspace(21000, 22400, 25)
+        upper, lower = calculate_bollinger_bands(pd.DataFrame({'Close': close}), period=20, std=2)
+        self.assertEqual(upper.iloc[-1], close[-1])
+        self.assertEqual(lower.iloc[-1], close[-1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from indicators import calculate_rsi, calculate_ema, calculate_macd, calculate_bollinger_bands
+from indicators_streaming import EMAState, RSIState, MACDState, BBState
+
+class TestStreamingIndicators(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.df = pd.DataFrame({'Close': 100 + np.cumsum(rng.normal(0, 1, 300))})
+        self.close = self.df['Close'].to_numpy()
+
+    def extend_in_chunks(self, state):
+        # Bulk history, a batch of new bars, then single ticks
+        parts = [state.extend(self.close[:200]), state.extend(self.close[200:290])]
+        for price in self.close[290:]:
+            value = state.update(price)
+            parts.append(tuple(np.array([v]) for v in value) if isinstance(value, tuple) else np.array([value]))
+        if isinstance(parts[0], tuple):
+            return tuple(np.concatenate(p) for p in zip(*parts))
+        return np.concatenate(parts)
+
+    def test_ema_matches_batch(self):
+        result = self.extend_in_chunks(EMAState(period=20))
+        np.testing.assert_allclose(result, calculate_ema(self.df, period=20).to_numpy(), rtol=1e-9)
+
+    def test_rsi_matches_batch(self):
+        result = self.extend_in_chunks(RSIState(period=14))
+        np.testing.assert_allclose(result, calculate_rsi(self.df, period=14).to_numpy(), rtol=1e-9)
+
+    def test_macd_matches_batch(self):
+        result = self.extend_in_chunks(MACDState())
+        for streamed, batch in zip(result, calculate_macd(self.df)):
+            np.testing.assert_allclose(streamed, batch.to_numpy(), atol=1e-9)
+
+    def test_bollinger_matches_batch(self):
+        result = self.extend_in_chunks(BBState(period=20, std=2))
+        for streamed, batch in zip(result, calculate_bollinger_bands(self.df, period=20, std=2)):
+            np.testing.assert_allclose(streamed, batch.to_numpy(), rtol=1e-9)
+
+    def test_missing_prices_match_batch(self):
+        # Gaps at the start, inside a chunk and across the chunk boundaries
+        self.close = self.close.copy()
+        self.close[[0, 1, 50, 51, 199, 200, 289, 290]] = np.nan
+        df = pd.DataFrame({'Close': self.close})
+        np.testing.assert_allclose(self.extend_in_chunks(EMAState(period=20)),
+                                   calculate_ema(df, period=20).to_numpy(), rtol=1e-9)
+        for streamed, batch in zip(self.extend_in_chunks(MACDState()), calculate_macd(df)):
+            np.testing.assert_allclose(streamed, batch.to_numpy(), atol=1e-9)
+        for streamed, batch in zip(self.extend_in_chunks(BBState(period=20, std=2)),
+                                   calculate_bollinger_bands(df, period=20, std=2)):
+            np.testing.assert_allclose(streamed, batch.to_numpy(), rtol=1e-9)
+
+    def test_integer_input_returns_float(self):
+        close = self.close.round().astype(np.int64)
+        ema = EMAState(period=20).extend(close)
+        self.assertEqual(ema.dtype, np.float64)
+        np.testing.assert_allclose(ema, EMAState(period=20).extend(close.astype(np.float64)), rtol=1e-12)
+        upper, lower = BBState(period=20, std=2).extend(close)
+        self.assertTrue(np.isnan(upper[:19]).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from patterns import detect_patterns, detect_patterns_batch, PATTERN_COLUMNS
+
+class TestPatterns(unittest.TestCase):
+    def setUp(self):
+        # Row 0: neutral candle
+        # Row 1: doji (open == close)
+        # Row 2: hammer (small body at the top, long lower wick)
+        # Row 3: red candle, Row 4: green candle engulfing it
+        # Row 5: bigger red candle engulfing row 4
+        self.df = pd.DataFrame({
+            'Open':  [100.0, 101.0, 104.0, 104.5, 101.5, 106.5],
+            'High':  [102.0, 103.0, 105.2, 105.5, 106.0, 107.0],
+            'Low':   [ 99.0,  99.0,  98.0, 101.5, 101.0,  99.0],
+            'Close': [101.0, 101.0, 105.0, 102.0, 106.0, 100.0],
+            'Volume': [1000.0] * 6
+        })
+
+    def test_doji(self):
+        result = detect_patterns(self.df)
+        self.assertEqual(result['Pattern_Doji'].tolist(), [False, True, False, False, False, False])
+
+    def test_hammer(self):
+        result = detect_patterns(self.df)
+        self.assertTrue(result['Pattern_Hammer'].iloc[2])
+        self.assertFalse(result['Pattern_Hammer'].iloc[0])
+
+    def test_engulfing(self):
+        result = detect_patterns(self.df)
+        self.assertEqual(result['Pattern_Bullish_Engulfing'].tolist(), [False, False, False, False, True, False])
+        self.assertEqual(result['Pattern_Bearish_Engulfing'].tolist(), [False, False, False, False, False, True])
+
+    def test_first_row_never_engulfing(self):
+        result = detect_patterns(self.df.iloc[4:])
+        self.assertFalse(result['Pattern_Bullish_Engulfing'].iloc[0])
+        self.assertTrue(result['Pattern_Bearish_Engulfing'].iloc[1])
+
+    def test_input_not_modified(self):
+        detect_patterns(self.df)
+        self.assertEqual(list(self.df.columns), ['Open', 'High', 'Low', 'Close', 'Volume'])
+
+    def test_returns_only_pattern_columns(self):
+        result = detect_patterns(self.df)
+        self.assertEqual(list(result.columns), PATTERN_COLUMNS)
+        self.assertTrue(result.index.equals(self.df.index))
+
+    def test_empty_and_all_nan_input(self):
+        empty = detect_patterns(self.df.iloc[:0])
+        self.assertEqual(list(empty.columns), PATTERN_COLUMNS)
+        self.assertEqual(len(empty), 0)
+
+        nan_df = self.df.copy()
+        nan_df[['Open', 'High', 'Low', 'Close']] = np.nan
+        result = detect_patterns(nan_df)
+        self.assertTrue((result.dtypes == bool).all())
+        self.assertFalse(result.to_numpy().any())
+
+    def test_strided_input(self):
+        # float32 frames are passed to the kernel without a copy, so slicing
+        # rows or wrapping a row-major block gives it strided price arrays
+        df32 = self.df.astype(np.float32)
+
+        # Every other row: rows 0, 2, 4 (neutral, hammer, green candle)
+        result = detect_patterns(df32.iloc[::2])
+        self.assertTrue(result.index.equals(self.df.index[::2]))
+        self.assertEqual(result['Pattern_Hammer'].tolist(), [False, True, False])
+
+        ohlc = ['Open', 'High', 'Low', 'Close']
+        block = np.ascontiguousarray(df32[ohlc].to_numpy())
+        view = pd.DataFrame(block, columns=ohlc, copy=False)
+        pd.testing.assert_frame_equal(detect_patterns(view), detect_patterns(self.df))
+
+    def test_writable_float32_input(self):
+        # float32 OHLC next to an int64 Volume, built one column at a time,
+        # reaches the kernel as writable contiguous arrays
+        df = pd.DataFrame(index=self.df.index)
+        for col in ['Open', 'High', 'Low', 'Close']:
+            df[col] = self.df[col].astype(np.float32)
+        df['Volume'] = self.df['Volume'].astype(np.int64)
+        pd.testing.assert_frame_equal(detect_patterns(df), detect_patterns(self.df))
+
+    def test_batch_matches_single(self):
+        frames = {'AAA': self.df, 'BBB': self.df.iloc[2:]}
+        results = detect_patterns_batch(frames, max_workers=2)
+        self.assertEqual(list(results), ['AAA', 'BBB'])
+        for symbol, frame in frames.items():
+            pd.testing.assert_frame_equal(results[symbol], detect_patterns(frame))
+
+if __name__ == '__main__':
+    unittest.main()